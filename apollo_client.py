@@ -1,10 +1,60 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
+import threading
 from typing import Dict, Any, Optional, List
 from config import APOLLO_API_KEY, APOLLO_BASE_URL
 
 logger = logging.getLogger(__name__)
 
+# Max pooled connections to Apollo (founder workers look up emails concurrently)
+SESSION_POOL_SIZE = 32
+
+# Apollo's bulk_match accepts at most 10 people per request
+BULK_MATCH_SIZE = 10
+
+# Placeholder Apollo returns instead of an email it hasn't unlocked
+LOCKED_EMAIL = 'email_not_unlocked@domain.com'
+
+
+def _parse_person(person: Dict[str, Any], apollo_id: str) -> Dict[str, Any]:
+    """
+    Shape an Apollo person record into founder data (locked email placeholder -> None).
+    """
+    email = person.get('email')
+    if email == LOCKED_EMAIL:
+        email = None
+    
+    return {
+        'apollo_id': apollo_id,
+        'first_name': person.get('first_name', ''),
+        'last_name': person.get('last_name', ''),
+        'full_name': person.get('name', ''),
+        'title': person.get('title', ''),
+        'email': email,
+        'linkedin_url': person.get('linkedin_url', ''),
+        'source': 'apollo'
+    }
+
+
+def _build_session() -> requests.Session:
+    """
+    Build a keep-alive session for Apollo with a pooled adapter. Transient failures
+    (429/5xx, connection errors) are retried with backoff; Apollo's lookups are
+    POSTs, so POST is retried too.
+    """
+    retry = Retry(
+        total=3,
+        status_forcelist=[429, 502, 503, 504],
+        backoff_factor=0.3,
+        allowed_methods=frozenset(['GET', 'POST']),
+        raise_on_status=False
+    )
+    session = requests.Session()
+    session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=SESSION_POOL_SIZE, max_retries=retry))
+    return session
+
 
 class ApolloClient:
     """
@@ -13,7 +63,7 @@ class ApolloClient:
     2. Email lookup when Specter email fails
     """
     
-    def __init__(self):
+    def __init__(self, session: Optional[requests.Session] = None):
         self.api_key = APOLLO_API_KEY
         self.base_url = APOLLO_BASE_URL
         self.headers = {
@@ -23,6 +73,9 @@ class ApolloClient:
             'x-api-key': self.api_key
         }
         
+        # Persistent session so keep-alive reuses connections across calls (callers may share one)
+        self.session = session or _build_session()
+        
         # Founder titles to search for
         self.founder_titles = [
             'founder',
@@ -34,6 +87,20 @@ class ApolloClient:
             'Chief Technology Officer'
         ]
     
+    def warm_up(self):
+        """
+        Open a pooled connection to Apollo in the background (DNS + TLS handshake),
+        so the first real request doesn't pay for it.
+        """
+        threading.Thread(target=self._warmup, daemon=True).start()
+    
+    def _warmup(self):
+        try:
+            self.session.head(self.base_url, timeout=2)
+            logger.debug("Apollo connection warmed up")
+        except requests.exceptions.RequestException as e:
+            logger.debug("Apollo warmup failed: %s", e)
+    
     def search_founders(self, domain: str) -> List[Dict[str, Any]]:
         """
         Search for founders/executives at a company by domain.
@@ -63,7 +130,7 @@ class ApolloClient:
         logger.info(f"Apollo fallback: Searching for founders at {domain}")
         
         try:
-            response = requests.post(url, headers=self.headers, params=params)
+            response = self.session.post(url, headers=self.headers, params=params)
             response.raise_for_status()
             
             data = response.json()
@@ -75,20 +142,29 @@ class ApolloClient:
             
             logger.info(f"Apollo fallback: Found {len(people)} potential founders at {domain}")
             
+            # Search results that already carry an unlocked email, LinkedIn URL and last
+            # name are complete; the rest are enriched by ID in bulk (LinkedIn URL, last name, email)
+            need_enrich = [
+                person['id'] for person in people
+                if person.get('id') and not self._is_complete(person)
+            ]
+            enriched_by_id = self.bulk_enrich_people(need_enrich) if need_enrich else {}
+            
             founders = []
             for person in people:
                 apollo_id = person.get('id')
                 title = person.get('title', '')
                 first_name = person.get('first_name', '')
                 
-                logger.info(f"   - {first_name} ({title}) - enriching...")
+                if apollo_id and self._is_complete(person):
+                    logger.info("   - %s (%s) - complete in search results", first_name, title)
+                    founders.append(_parse_person(person, apollo_id))
+                    continue
                 
-                # Enrich by ID to get full data (LinkedIn URL, last name, email)
-                if apollo_id:
-                    enriched = self.enrich_person_by_id(apollo_id)
-                    if enriched:
-                        founders.append(enriched)
-                        continue
+                enriched = enriched_by_id.get(apollo_id)
+                if enriched:
+                    founders.append(enriched)
+                    continue
                 
                 # Fallback to basic data if enrichment fails
                 last_name = person.get('last_name', '')
@@ -116,6 +192,70 @@ class ApolloClient:
             logger.warning(f"Apollo founder search parse error: {e}")
             return []
     
+    @staticmethod
+    def _is_complete(person: Dict[str, Any]) -> bool:
+        """
+        True if a search result already has everything enrichment would add.
+        """
+        email = person.get('email')
+        return bool(email and email != LOCKED_EMAIL and person.get('linkedin_url') and person.get('last_name'))
+    
+    def bulk_enrich_people(self, apollo_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Enrich people by Apollo ID with /people/bulk_match, 10 per request
+        instead of one /people/match call each.
+        
+        Args:
+            apollo_ids: Apollo person IDs from search results
+            
+        Returns:
+            Dict mapping each matched ID to its person data (unmatched IDs are omitted)
+        """
+        if not self.api_key or not apollo_ids:
+            return {}
+        
+        url = f"{self.base_url}/people/bulk_match"
+        enriched = {}
+        
+        for start in range(0, len(apollo_ids), BULK_MATCH_SIZE):
+            batch = apollo_ids[start:start + BULK_MATCH_SIZE]
+            payload = {
+                "details": [{"id": apollo_id} for apollo_id in batch],
+                "reveal_personal_emails": False,
+                "reveal_phone_number": False
+            }
+            
+            logger.info("Apollo: Bulk enriching %d people by ID", len(batch))
+            
+            try:
+                response = self.session.post(url, headers=self.headers, json=payload)
+                response.raise_for_status()
+                
+                matches = response.json().get('matches') or []
+            except requests.exceptions.RequestException as e:
+                logger.error("Apollo bulk enrich error: %s", e)
+                continue
+            except (ValueError, KeyError) as e:
+                logger.warning("Apollo bulk enrich parse error: %s", e)
+                continue
+            
+            # Key matches on the ID Apollo returns rather than position; a person
+            # missing from the response (or a null entry) counts as unmatched
+            matched = {person.get('id'): person for person in matches if person}
+            for apollo_id in batch:
+                person = matched.get(apollo_id)
+                if not person:
+                    logger.warning("Apollo: No person data for ID %s", apollo_id)
+                    continue
+                result = _parse_person(person, apollo_id)
+                enriched[apollo_id] = result
+                logger.info(
+                    "Apollo: Enriched %s | Email: %s | LinkedIn: %s",
+                    result['full_name'], result['email'] or 'N/A', '✓' if result['linkedin_url'] else 'N/A'
+                )
+        
+        return enriched
+    
     def enrich_person_by_id(self, apollo_id: str) -> Optional[Dict[str, Any]]:
         """
         Enrich a person by their Apollo ID to get full data including LinkedIn URL and email.
@@ -139,7 +279,7 @@ class ApolloClient:
         logger.info(f"Apollo: Enriching person by ID {apollo_id}")
         
         try:
-            response = requests.post(url, headers=self.headers, params=params)
+            response = self.session.post(url, headers=self.headers, params=params)
             response.raise_for_status()
             
             data = response.json()
@@ -149,23 +289,12 @@ class ApolloClient:
                 logger.warning(f"Apollo: No person data for ID {apollo_id}")
                 return None
             
-            # Extract email (filter out placeholder)
-            email = person.get('email')
-            if email == 'email_not_unlocked@domain.com':
-                email = None
-            
-            result = {
-                'apollo_id': apollo_id,
-                'first_name': person.get('first_name', ''),
-                'last_name': person.get('last_name', ''),
-                'full_name': person.get('name', ''),
-                'title': person.get('title', ''),
-                'email': email,
-                'linkedin_url': person.get('linkedin_url', ''),
-                'source': 'apollo'
-            }
+            result = _parse_person(person, apollo_id)
             
-            logger.info(f"Apollo: Enriched {result['full_name']} | Email: {email or 'N/A'} | LinkedIn: {'✓' if result['linkedin_url'] else 'N/A'}")
+            logger.info(
+                "Apollo: Enriched %s | Email: %s | LinkedIn: %s",
+                result['full_name'], result['email'] or 'N/A', '✓' if result['linkedin_url'] else 'N/A'
+            )
             return result
             
         except requests.exceptions.RequestException as e:
@@ -198,7 +327,7 @@ class ApolloClient:
         logger.info(f"Apollo fallback: Looking up email for {linkedin_url}")
         
         try:
-            response = requests.post(url, headers=self.headers, json=payload)
+            response = self.session.post(url, headers=self.headers, json=payload)
             response.raise_for_status()
             
             data = response.json()
@@ -206,7 +335,7 @@ class ApolloClient:
             
             if person:
                 email = person.get('email')
-                if email and email != 'email_not_unlocked@domain.com':
+                if email and email != LOCKED_EMAIL:
                     logger.info(f"Apollo fallback: Found email {email}")
                     return email
                 else:
@@ -247,7 +376,7 @@ class ApolloClient:
         logger.info(f"Apollo fallback: Looking up {first_name} {last_name} at {domain}")
         
         try:
-            response = requests.post(url, headers=self.headers, json=payload)
+            response = self.session.post(url, headers=self.headers, json=payload)
             response.raise_for_status()
             
             data = response.json()
@@ -255,7 +384,7 @@ class ApolloClient:
             
             if person:
                 email = person.get('email')
-                if email and email != 'email_not_unlocked@domain.com':
+                if email and email != LOCKED_EMAIL:
                     logger.info(f"Apollo fallback: Found email {email}")
                     return email
                     
@@ -7,6 +7,9 @@ app = Flask(__name__)
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Shared across requests so API clients and their connection pools are reused by warm instances
+enrichment_service = EnrichmentService()
+
 @app.route('/health', methods=['GET'])
 def health():
     return jsonify({"status": "healthy", "message": "Company enrichment API is running"})
@@ -29,7 +32,6 @@ def enrich():
         
         logger.info(f"Enrichment request: domain={domain}, list_source={list_source}")
         
-        enrichment_service = EnrichmentService()
         result = enrichment_service.enrich_company(domain, list_source)
         
         return jsonify(result), 200
@@ -56,7 +58,6 @@ def webhook():
         
         logger.info(f"Webhook request: domain={domain}, list_source={list_source}")
         
-        enrichment_service = EnrichmentService()
         result = enrichment_service.enrich_company(domain, list_source)
         
         return jsonify(result), 200
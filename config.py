@@ -12,9 +12,34 @@ GEMINI_API_KEY = os.getenv('GEMINI_API_KEY')
 # Specter API Configuration
 SPECTER_BASE_URL = 'https://app.tryspecter.com/api/v1'
 
+# Specter request budget per process (0 disables limiting)
+SPECTER_RATE_LIMIT_PER_MINUTE = int(os.getenv('SPECTER_RATE_LIMIT_PER_MINUTE', '60'))
+
+# Local cache for Specter lookups: in-process LRU + SQLite file (set SPECTER_CACHE_PATH to '' for memory only)
+SPECTER_CACHE_PATH = os.getenv('SPECTER_CACHE_PATH', '.specter_cache.sqlite')
+SPECTER_CACHE_TTL = int(os.getenv('SPECTER_CACHE_TTL', str(7 * 86400)))
+
 # Apollo API Configuration (fallback for email lookup)
 APOLLO_BASE_URL = 'https://api.apollo.io/api/v1'
 
+# Retries for transient API failures (429 / 5xx / connection errors)
+SPECTER_MAX_RETRIES = int(os.getenv('SPECTER_MAX_RETRIES', '5'))
+# OpenAI keeps the SDK default (2): classification blocks the /enrich response, and each try may take the 30s timeout
+OPENAI_MAX_RETRIES = int(os.getenv('OPENAI_MAX_RETRIES', '2'))
+
+# Default max seconds to keep polling Specter person/email lookups that return 202.
+# 0 returns pending immediately, keeping synchronous /enrich and /webhook requests short;
+# batch callers (the CLI) pass a longer wait per call
+SPECTER_POLL_MAX_WAIT = float(os.getenv('SPECTER_POLL_MAX_WAIT', '0'))
+
+# Semantic cache for industry classification (cosine similarity threshold / max cached companies)
+SEMANTIC_CACHE_THRESHOLD = float(os.getenv('SEMANTIC_CACHE_THRESHOLD', '0.9'))
+SEMANTIC_CACHE_MAX_ENTRIES = int(os.getenv('SEMANTIC_CACHE_MAX_ENTRIES', '1000'))
+
+# Persistent exact-match cache of industry classifications, keyed by company fingerprint ('' for memory only)
+CLASSIFY_CACHE_PATH = os.getenv('CLASSIFY_CACHE_PATH', '.classify_cache.sqlite')
+CLASSIFY_CACHE_TTL = int(os.getenv('CLASSIFY_CACHE_TTL', str(30 * 86400)))
+
 # Valid list sources
 VALID_LIST_SOURCES = ['james', 'zi', 'jeff']
 
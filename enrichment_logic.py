@@ -1,19 +1,35 @@
 import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Dict, List, Any, Optional, Tuple
-from specter_client import SpecterClient
+from specter_client import SpecterClient, split_full_name
 from apollo_client import ApolloClient
 from openai_client import OpenAIClient
 from gemini_client import filter_vc_investors, rank_top_investors, resolve_investor_domain
-from config import VALID_LIST_SOURCES, OWNER_ASSIGNMENTS
+from config import VALID_LIST_SOURCES, OWNER_ASSIGNMENTS, SPECTER_POLL_MAX_WAIT
 
 logger = logging.getLogger(__name__)
 
+# Max founders enriched concurrently (each founder is a few sequential API calls)
+FOUNDER_WORKERS = 8
+
 class EnrichmentService:
     def __init__(self):
         self.specter_client = SpecterClient()
         self.apollo_client = None  # Initialize lazily (fallback for email)
+        self._apollo_lock = threading.Lock()
         self.openai_client = None  # Initialize lazily
     
+    def warm_up(self):
+        """
+        Warm DNS/TLS for every API client in the background (returns immediately)
+        """
+        if self.openai_client is None:
+            self.openai_client = OpenAIClient()
+        self.openai_client.warm_up()
+        self.specter_client.warm_up()
+        self._get_apollo_client().warm_up()
+    
     def validate_list_source(self, list_source: str) -> Tuple[bool, Optional[str]]:
         """
         Validate list source and determine owner
@@ -30,9 +46,13 @@ class EnrichmentService:
         logger.warning(f"Invalid list source: {list_source}")
         return False, None
     
-    def enrich_company(self, domain: str, list_source: str) -> Dict[str, Any]:
+    def enrich_company(self, domain: str, list_source: str, bypass_cache: bool = False,
+                       poll_max_wait: float = SPECTER_POLL_MAX_WAIT) -> Dict[str, Any]:
         """
-        Main enrichment pipeline using Specter API
+        Main enrichment pipeline using Specter API.
+        bypass_cache skips cached company, founder and email lookups and classifications.
+        poll_max_wait is how long founder lookups wait on Specter enrichment in
+        progress (202) before using basic data; batch callers can afford more.
         """
         logger.info(f"🚀 Starting enrichment: {domain} ({list_source})")
         
@@ -46,29 +66,32 @@ class EnrichmentService:
         
         # Step 0: Get company info (includes founder_info)
         logger.info("📍 Step 0: Company enrichment")
-        company_data = self.specter_client.get_company_by_domain(domain)
+        company_data = self.specter_client.get_company_by_domain(domain, bypass_cache=bypass_cache)
         
         # Initialize OpenAI client
         if self.openai_client is None:
             self.openai_client = OpenAIClient()
         
+        # Vertical classification and the investor pipeline only need company data,
+        # so they run in the background, overlapping founder/email lookups below
+        background = ThreadPoolExecutor(max_workers=2)
+        industry_future = None
         if company_data:
             logger.info(f"✅ Company: {company_data['name']}")
             
-            # Classify industry
-            logger.info("🤖 Analyzing vertical...")
-            industry = self.openai_client.classify_industry(company_data)
-            logger.info(f"✅ Vertical: {industry}")
+            logger.info("🤖 Analyzing vertical (in background)...")
+            industry_future = background.submit(self.openai_client.classify_industry, company_data, bypass_cache)
             
-            # Prepare company info
+            # Prepare company info (industry filled in once classification completes).
+            # company_data always has these keys (see specter_client._parse_company)
             company_info = {
-                "name": company_data.get('name', 'Unknown'),
+                "name": company_data['name'],
                 "domain": domain,
-                "industry": industry,
-                "location": company_data.get('location', 'Unknown'),
-                "employee_count": company_data.get('employee_count', 0),
-                "linkedin": company_data.get('linkedin_url', ''),
-                "description": company_data.get('description', '')
+                "industry": "Unknown",
+                "location": company_data['location'],
+                "employee_count": company_data['employee_count'],
+                "linkedin": company_data['linkedin_url'],
+                "description": company_data['description']
             }
         else:
             # Specter didn't find company - use basic info and Apollo fallback for founders
@@ -85,148 +108,69 @@ class EnrichmentService:
                 "description": ""
             }
         
+        # Step 4 (background): top investors; ranking waits on the vertical
+        logger.info("💰 Step 4: Processing investors (in background)...")
+        investors_future = background.submit(self._get_top_investors, company_data, company_info, industry_future)
+        background.shutdown(wait=False)
+        
         # Step 1: Get founders from company data (Specter includes founder_info in company response)
         logger.info("👥 Step 1: Processing founders from company data")
         founder_info_list = company_data.get('founder_info', [])
         logger.info(f"📊 Found {len(founder_info_list)} founders in company data")
         
+        # Founders without a Specter person ID can't be enriched; drop them before fan-out
+        candidates = [f for f in founder_info_list if f.get('specter_person_id')]
+        skipped = len(founder_info_list) - len(candidates)
+        if skipped:
+            logger.warning("⚠️  Skipping %d founders with no person ID", skipped)
+        
         founders = []
-        if founder_info_list:
-            for i, founder_basic in enumerate(founder_info_list, 1):
-                person_id = founder_basic.get('specter_person_id')
-                basic_name = founder_basic.get('full_name', 'Unknown')
-                basic_title = founder_basic.get('title', '')
-                
-                logger.info(f"  [{i}] {basic_name} ({basic_title})")
-                
-                if not person_id:
-                    logger.warning(f"      ⚠️  No person ID available, skipping")
-                    continue
-                
-                # Step 2: Get full person details
-                logger.info(f"      🔍 Fetching person details...")
-                person_data = self.specter_client.get_person(person_id)
-                
-                if person_data and person_data.get('status') == 'pending':
-                    logger.warning(f"      ⏳ Person enrichment pending (202)")
-                    # Include with basic data only
-                    self._add_founder_to_list(
-                        founders, basic_name, 
-                        basic_name.split()[0] if basic_name != 'Unknown' else 'Unknown',
-                        ' '.join(basic_name.split()[1:]) if basic_name != 'Unknown' else '',
-                        basic_title, '',
-                        '',
-                        company_info, industry, owner
-                    )
-                    continue
-                
-                if not person_data:
-                    logger.warning(f"      ⚠️  Could not fetch person details")
-                    continue
-                
-                # Extract person info
-                full_name = person_data.get('full_name', basic_name)
-                first_name = person_data.get('first_name', '')
-                last_name = person_data.get('last_name', '')
-                title = person_data.get('title', '') or basic_title
-                linkedin_url = person_data.get('linkedin_url', '')
-                
-                # Step 3: Get email (Specter first, Apollo fallback)
-                logger.info(f"      📧 Fetching email...")
-                email = self.specter_client.get_person_email(person_id)
-                
-                if email:
-                    logger.info(f"      ✅ Email (Specter): {email}")
-                else:
-                    # Apollo fallback - try by LinkedIn URL first, then by name
-                    logger.info(f"      🔄 Specter failed, trying Apollo fallback...")
-                    if self.apollo_client is None:
-                        self.apollo_client = ApolloClient()
-                    
-                    if linkedin_url:
-                        email = self.apollo_client.get_email_by_linkedin(linkedin_url)
-                    
-                    if not email and first_name and last_name:
-                        email = self.apollo_client.enrich_person(first_name, last_name, company_info['domain'])
-                    
-                    if email:
-                        logger.info(f"      ✅ Email (Apollo): {email}")
-                    else:
-                        logger.warning(f"      ⚠️  No email available from either source")
-                
-                # Add founder to list
-                self._add_founder_to_list(
-                    founders, full_name, first_name, last_name,
-                    title, email or '',
-                    linkedin_url,
-                    company_info, industry, owner
-                )
+        if candidates:
+            # Steps 2 & 3 run per founder, concurrently (each waits on Specter/Apollo I/O)
+            founders = self._map_founders(
+                self._process_specter_founder, candidates, company_info, bypass_cache, poll_max_wait
+            )
         
         # Apollo fallback: Search for founders if Specter has none
         if not founders:
             logger.info("🔄 No founders from Specter, trying Apollo fallback...")
-            if self.apollo_client is None:
-                self.apollo_client = ApolloClient()
-            
-            apollo_founders = self.apollo_client.search_founders(domain)
+            apollo_founders = self._get_apollo_client().search_founders(domain)
             
             if apollo_founders:
                 logger.info(f"✅ Apollo found {len(apollo_founders)} founders")
-                for i, af in enumerate(apollo_founders, 1):
-                    # Use Apollo data (already enriched by ID in search_founders)
-                    full_name = af.get('full_name', 'Unknown')
-                    first_name = af.get('first_name', '')
-                    last_name = af.get('last_name', '')
-                    title = af.get('title', '')
-                    email = af.get('email', '')
-                    linkedin_url = af.get('linkedin_url', '')
-                    
-                    logger.info(f"  [{i}] {full_name} ({title})")
-                    
-                    if email:
-                        logger.info(f"      ✅ Email (Apollo): {email}")
-                    
-                    # Specter fallback: Only if Apollo has no email but has LinkedIn
-                    if not email and linkedin_url:
-                        logger.info(f"      🔄 No Apollo email, trying Specter via LinkedIn...")
-                        specter_person = self.specter_client.lookup_person_by_linkedin(linkedin_url)
-                        
-                        if specter_person and specter_person.get('person_id'):
-                            person_id = specter_person['person_id']
-                            specter_email = self.specter_client.get_person_email(person_id)
-                            if specter_email:
-                                email = specter_email
-                                logger.info(f"      ✅ Email (Specter fallback): {email}")
-                    
-                    if not email:
-                        logger.warning(f"      ⚠️  No email available")
-                    
-                    self._add_founder_to_list(
-                        founders, full_name, first_name, last_name,
-                        title, email or '',
-                        linkedin_url,
-                        company_info, industry, owner
-                    )
+                founders = self._map_founders(self._process_apollo_founder, apollo_founders)
             else:
                 logger.warning("❌ Apollo also found no founders")
         
-        # Step 4: Get top investors with domains
-        logger.info("💰 Step 4: Processing investors")
-        investors_list = self._get_top_investors(company_data, company_info)
+        # Join the background classification before generating emails
+        if industry_future is not None:
+            industry = industry_future.result()
+            company_info["industry"] = industry
+            logger.info("✅ Vertical: %s", industry)
+        
+        # Generate personalized emails now that the vertical is known
+        if founders:
+            logger.info("  ✉️  Generating emails for %d founders...", len(founders))
+            emails = self.openai_client.generate_emails(company_info, founders, industry, owner)
+            for founder, email in zip(founders, emails):
+                founder['generated_email'] = email
+        
+        # Join the background investor pipeline
+        investors_list = investors_future.result()
         logger.info(f"✅ Found {len(investors_list)} top investors")
         
         # Flatten investors to individual fields for Zapier compatibility
         investor_fields = {}
         for i in range(3):  # Always output 3 investor slots
             if i < len(investors_list):
-                investor_fields[f"investor_{i+1}_name"] = investors_list[i].get("name", "")
-                investor_fields[f"investor_{i+1}_domain"] = investors_list[i].get("domain", "")
+                investor_fields[f"investor_{i+1}_name"] = investors_list[i]["name"]
+                investor_fields[f"investor_{i+1}_domain"] = investors_list[i]["domain"]
             else:
                 investor_fields[f"investor_{i+1}_name"] = ""
                 investor_fields[f"investor_{i+1}_domain"] = ""
         
         # Determine status
-        if founders and any(f.get('email') for f in founders):
+        if founders and any(f['email'] for f in founders):
             status = "enriched"
             logger.info(f"✅ Status: enriched - {len(founders)} founders with emails")
         elif founders:
@@ -247,10 +191,138 @@ class EnrichmentService:
         
         return result
     
-    def _add_founder_to_list(self, founders_list, full_name, first_name, last_name,
-                            title, email, linkedin, company_info, industry, owner):
+    def _get_apollo_client(self) -> ApolloClient:
         """
-        Helper to add a founder with generated email to the list
+        Return the Apollo client, creating it on first use (safe to call from founder workers)
+        """
+        with self._apollo_lock:
+            if self.apollo_client is None:
+                self.apollo_client = ApolloClient()
+            return self.apollo_client
+    
+    def _map_founders(self, fn, items: List[Dict[str, Any]], *args) -> List[Dict[str, Any]]:
+        """
+        Call fn(i, item, *args) for each founder item (i is 1-based) on a bounded thread
+        pool, keeping input order. A founder whose processing fails (or returns None)
+        is dropped without sinking the rest.
+        """
+        def run(i, item):
+            try:
+                return fn(i, item, *args)
+            except Exception as e:
+                logger.error("      ❌ [%d] Founder processing failed: %s", i, e)
+                return None
+        
+        with ThreadPoolExecutor(max_workers=min(FOUNDER_WORKERS, len(items))) as executor:
+            results = executor.map(run, range(1, len(items) + 1), items)
+            return [founder for founder in results if founder]
+    
+    def _process_specter_founder(self, i: int, founder_basic: Dict[str, Any],
+                                 company_info: Dict[str, Any], bypass_cache: bool = False,
+                                 poll_max_wait: float = SPECTER_POLL_MAX_WAIT) -> Optional[Dict[str, Any]]:
+        """
+        Steps 2 & 3 for one Specter founder: person details + email (Apollo fallback)
+        """
+        person_id = founder_basic['specter_person_id']
+        basic_name = founder_basic.get('full_name', 'Unknown')
+        basic_title = founder_basic.get('title', '')
+        
+        logger.info("  [%d] %s (%s)", i, basic_name, basic_title)
+        
+        # Steps 2 & 3: Get full person details, then the Specter email. Both run on this
+        # founder's worker (founders are already enriched concurrently), and the email is
+        # only fetched for a person Specter returned
+        logger.info("      🔍 [%d] Fetching person details and email...", i)
+        person_data = self.specter_client.get_person(person_id, bypass_cache=bypass_cache, max_wait=poll_max_wait)
+        if not person_data:
+            logger.warning("      ⚠️  [%d] Could not fetch person details", i)
+            return None
+        
+        email = self.specter_client.get_person_email(person_id, bypass_cache=bypass_cache, max_wait=poll_max_wait)
+        
+        if person_data.get('status') == 'pending':
+            logger.warning("      ⏳ [%d] Person enrichment pending (202)", i)
+            # Include with basic data only
+            first_name, last_name = split_full_name(basic_name)
+            return self._build_founder(
+                basic_name, first_name, last_name,
+                basic_title, email or '',
+                ''
+            )
+        
+        # Extract person info (person_data always has these keys, see specter_client._parse_person)
+        full_name = person_data['full_name']
+        first_name = person_data['first_name']
+        last_name = person_data['last_name']
+        title = person_data['title'] or basic_title
+        linkedin_url = person_data['linkedin_url']
+        
+        # Step 3: Email (Specter first, Apollo fallback)
+        if email:
+            logger.info("      ✅ [%d] Email (Specter): %s", i, email)
+        else:
+            # Apollo fallback - try by LinkedIn URL first, then by name
+            logger.info("      🔄 [%d] Specter failed, trying Apollo fallback...", i)
+            apollo_client = self._get_apollo_client()
+            
+            if linkedin_url:
+                email = apollo_client.get_email_by_linkedin(linkedin_url)
+            
+            if not email and first_name and last_name:
+                email = apollo_client.enrich_person(first_name, last_name, company_info['domain'])
+            
+            if email:
+                logger.info("      ✅ [%d] Email (Apollo): %s", i, email)
+            else:
+                logger.warning("      ⚠️  [%d] No email available from either source", i)
+        
+        return self._build_founder(
+            full_name, first_name, last_name,
+            title, email or '',
+            linkedin_url
+        )
+    
+    def _process_apollo_founder(self, i: int, af: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build one founder from Apollo search data, with Specter (via LinkedIn) as email fallback
+        """
+        # Use Apollo data (already enriched by ID in search_founders; every record has these keys)
+        full_name = af['full_name']
+        first_name = af['first_name']
+        last_name = af['last_name']
+        title = af['title']
+        email = af['email']
+        linkedin_url = af['linkedin_url']
+        
+        logger.info("  [%d] %s (%s)", i, full_name, title)
+        
+        if email:
+            logger.info("      ✅ [%d] Email (Apollo): %s", i, email)
+        
+        # Specter fallback: Only if Apollo has no email but has LinkedIn
+        if not email and linkedin_url:
+            logger.info("      🔄 [%d] No Apollo email, trying Specter via LinkedIn...", i)
+            specter_person = self.specter_client.lookup_person_by_linkedin(linkedin_url)
+            
+            if specter_person and specter_person.get('person_id'):
+                person_id = specter_person['person_id']
+                specter_email = self.specter_client.get_person_email(person_id)
+                if specter_email:
+                    email = specter_email
+                    logger.info("      ✅ [%d] Email (Specter fallback): %s", i, email)
+        
+        if not email:
+            logger.warning("      ⚠️  [%d] No email available", i)
+        
+        return self._build_founder(
+            full_name, first_name, last_name,
+            title, email or '',
+            linkedin_url
+        )
+    
+    def _build_founder(self, full_name, first_name, last_name, title, email, linkedin) -> Dict[str, Any]:
+        """
+        Helper to build a founder entry (generated email is attached later)
         """
         founder_info = {
             "name": full_name,
@@ -261,20 +333,16 @@ class EnrichmentService:
             "linkedin": linkedin
         }
         
-        # Generate personalized email
-        logger.info(f"      ✉️  Generating email...")
-        email_content = self.openai_client.generate_email(
-            company_info, founder_info, industry, owner
-        )
-        founder_info['generated_email'] = email_content
-        
-        founders_list.append(founder_info)
-        logger.info(f"      ➕ Added to list")
+        logger.info("      ➕ Added %s to list", full_name)
+        return founder_info
     
-    def _get_top_investors(self, company_data: Dict[str, Any], company_info: Dict[str, Any]) -> List[Dict[str, str]]:
+    def _get_top_investors(self, company_data: Dict[str, Any], company_info: Dict[str, Any],
+                           industry_future: Optional[Future] = None) -> List[Dict[str, str]]:
         """
         Get top 3 investors with their domains.
         Pipeline: Extract investors -> Filter VCs/accelerators -> Rank top 3 -> Resolve domains
+        If industry_future is given, filtering overlaps the vertical classification and
+        ranking waits for it.
         """
         # Extract raw investors from Specter company data
         raw_investors = company_data.get('investors', [])
@@ -299,10 +367,11 @@ class EnrichmentService:
             
             # Step 2: Rank top 3
             logger.info("   🏆 Ranking top 3 investors...")
-            company_context = f"{company_info.get('industry', 'Tech')}, {company_info.get('location', '')}"
+            industry = industry_future.result() if industry_future else company_info['industry']
+            company_context = f"{industry}, {company_info['location']}"
             ranked = rank_top_investors(
                 included,
-                company_name=company_info.get('name'),
+                company_name=company_info['name'],
                 company_context=company_context
             )
             top_names = ranked.get('top_names', [])
@@ -313,12 +382,14 @@ class EnrichmentService:
             
             logger.info(f"   ✅ Top investors: {top_names}")
             
-            # Step 3: Resolve domains for each
+            # Step 3: Resolve domains for each (independent lookups, run concurrently)
             logger.info("   🌐 Resolving domains...")
             investors_with_domains = []
             
-            for name in top_names:
-                result = resolve_investor_domain(name)
+            with ThreadPoolExecutor(max_workers=len(top_names)) as executor:
+                results = list(executor.map(resolve_investor_domain, top_names))
+            
+            for name, result in zip(top_names, results):
                 domain = result.get('domain')
                 
                 investor_entry = {
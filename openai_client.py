@@ -1,74 +1,287 @@
 import openai
 import logging
 import json
-from typing import Dict, Any
-from config import OPENAI_API_KEY, CALENDLY_LINKS
+import operator
+import re
+import threading
+from typing import Dict, Any, List, Optional, Tuple
+from config import (
+    OPENAI_API_KEY, OPENAI_MAX_RETRIES, CALENDLY_LINKS, OWNER_ASSIGNMENTS, SEMANTIC_CACHE_THRESHOLD, SEMANTIC_CACHE_MAX_ENTRIES,
+    CLASSIFY_CACHE_PATH, CLASSIFY_CACHE_TTL
+)
+from response_cache import ResponseCache
+from singleflight import SingleFlight, make_key
 
 logger = logging.getLogger(__name__)
 
+# Base opening paragraph shared by every email
+EMAIL_OPENING = "I just came across you guys and wanted to introduce our fund, ScOp Venture Capital - our team all comes from operating backgrounds in software, and we lead pre-seed through Series A rounds in vertical software and AI."
+
+# Vertical-specific content appended to the opening
+VERTICAL_ADDITIONS = {
+    "Financial Services": "We have experience with companies in financial services - our portfolio company Rogo raised a $50m Series B from Thrive building a full AI suite for banks and large financial institutions.",
+    "Construction": "We have deep experience and network in construction - our partner Kevin wrote the first check to Procore, and we have the CEO and lots of early Procore employees as LPs.",
+    "Proptech": "We have strong experience in proptech, and have the founders of Appfolio and Procore as LPs.",
+    "AI Infrastructure": "Our partners Kevin and Ivan built and sold the knowledge graph software that powered Amazon Alexa, and we have founders of MongoDB, Twilio, DoubleClick, and more as LPs.",
+    "HealthTech": "We have some experience in healthcare - our portfolio includes a patient communications company, an RCM platform, and a consumer health tracking app.",
+    "Vertical SaaS": "Our partner Kevin founded DoubleClick (sold to Google), and Graphiq (sold to Amazon) - we have the founders of Procore, Appfolio, MongoDB, Twilio, and more as LPs.",
+}
+
+# Location-specific content appended after the vertical content
+LOCATION_ADDITIONS = {
+    "New York": "We have several portcos in New York as well (Rogo, Promptlayer, Pangram Labs, SuiteOp).",
+    "Southern California": "We're based in Santa Barbara and have pretty good local coverage and network throughout SoCal.",
+}
+
+# Location buckets in priority order (New York wins when several match), each a
+# precompiled substring search over the company location
+SOCAL_CITIES = ['Los Angeles', 'San Diego', 'Santa Barbara', 'San Luis Obispo']
+LOCATION_PATTERNS = [
+    ('New York', re.compile(re.escape('New York'))),
+    ('Southern California', re.compile("|".join(map(re.escape, SOCAL_CITIES)))),
+]
+
+# Opening paragraph for every (vertical, location) pair, built once at import
+EMAIL_OPENINGS = {
+    (vertical, location): " ".join(
+        part for part in (EMAIL_OPENING, VERTICAL_ADDITIONS.get(vertical), LOCATION_ADDITIONS.get(location)) if part
+    )
+    for vertical in (None, *VERTICAL_ADDITIONS)
+    for location in (None, *LOCATION_ADDITIONS)
+}
+
+# Owner email -> (sender name, Calendly link)
+OWNER_TABLE = {
+    owner: (name.capitalize(), CALENDLY_LINKS.get(name, ''))
+    for name, owner in OWNER_ASSIGNMENTS.items()
+}
+
+EMAIL_TEMPLATE = (
+    "{greeting}\n\n"
+    "{opening}\n\n"
+    "{company_name} looks really interesting, I would love to learn more about the business and what you've built.\n\n"
+    "Any times work to chat in the next few weeks? {calendly_link}\n\n"
+    "All the best!\n\n{sender_name}"
+)
+
+
+# Static classification instructions (the baseline rules, unpadded). Kept byte-identical
+# across calls as the system message; only the short per-company user message varies.
+CLASSIFIER_SYSTEM_PROMPT = """Analyze company data to determine applicable vertical for ScOp VC's cold emails.
+
+Return ONLY a JSON object with the vertical's short label:
+{
+  "vertical": "LABEL or null"
+}
+
+Label must be ONE of: "FS", "CONS", "PROP", "AI", "HEALTH", "VSAAS", or null
+
+RULES:
+- HEALTH (HealthTech): healthcare, hospitals, clinical, medical, patient care, surgery centers, healthcare operations
+- FS (Financial Services): fintech, banking, payments, lending, insurance, accounting
+- CONS (Construction): construction tech, contractors, building, BIM, project management for construction
+- PROP (Proptech): property management, real estate tech, facility management (NOT construction)
+- AI (AI Infrastructure): LLM, vector databases, AI/ML ops, foundation models, knowledge graphs
+- VSAAS (Vertical SaaS): Any B2B SaaS targeting specific industry not above
+- null: if unclear or consumer software
+
+Return ONLY the JSON, no markdown or explanation."""
+
+# Classifier labels -> vertical names. Short labels keep the completion to a handful of tokens.
+VERTICAL_LABELS = {
+    "FS": "Financial Services",
+    "CONS": "Construction",
+    "PROP": "Proptech",
+    "AI": "AI Infrastructure",
+    "HEALTH": "HealthTech",
+    "VSAAS": "Vertical SaaS",
+}
+
+# Structured output schema: the model can only emit {"vertical": <one of VERTICAL_LABELS or null>}
+VERTICAL_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "vertical",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "vertical": {
+                    "type": ["string", "null"],
+                    "enum": list(VERTICAL_LABELS) + [None]
+                }
+            },
+            "required": ["vertical"],
+            "additionalProperties": False
+        }
+    }
+}
+
+
+try:
+    # C-level dot product (Python 3.12+)
+    from math import sumprod as _dot
+except ImportError:
+    def _dot(a: List[float], b: List[float]) -> float:
+        return sum(map(operator.mul, a, b))
+
+
+class SemanticVerticalCache:
+    """
+    In-process cache mapping company embeddings to their classified vertical.
+    A lookup hits when cosine similarity to a stored embedding exceeds the threshold,
+    so differently-worded descriptions of the same business share one classification.
+    """
+    
+    def __init__(self, threshold: float, max_entries: int):
+        self.threshold = threshold
+        self.max_entries = max_entries
+        # Immutable (embedding, vertical) pairs, replaced wholesale on add so lookups
+        # can scan a snapshot without locking or copying
+        self._entries: Tuple[Tuple[List[float], str], ...] = ()
+        self._lock = threading.Lock()
+    
+    def lookup(self, embedding: List[float]) -> Optional[str]:
+        """Return the cached vertical of the most similar company, or None on a miss."""
+        best_score, best_vertical = 0.0, None
+        for cached, vertical in self._entries:
+            # OpenAI embeddings are unit-length, so the dot product is the cosine similarity
+            score = _dot(embedding, cached)
+            if score > best_score:
+                best_score, best_vertical = score, vertical
+        
+        if best_score > self.threshold:
+            logger.info("Semantic cache hit (similarity %.3f) - Vertical: %s", best_score, best_vertical)
+            return best_vertical
+        return None
+    
+    def add(self, embedding: List[float], vertical: str):
+        with self._lock:
+            # Oldest entries drop off once max_entries is reached
+            self._entries = (self._entries + ((embedding, vertical),))[-self.max_entries:]
+
+
+# Shared across OpenAIClient instances (one is created per enrichment request)
+_vertical_cache = SemanticVerticalCache(SEMANTIC_CACHE_THRESHOLD, SEMANTIC_CACHE_MAX_ENTRIES)
+
+# Coalesces concurrent classifications of the same company
+_inflight = SingleFlight()
+
+# Exact-match classifications persisted across runs (same company data -> same vertical)
+_classify_cache = ResponseCache(CLASSIFY_CACHE_PATH, CLASSIFY_CACHE_TTL)
+
+
 class OpenAIClient:
     def __init__(self):
         self.client = openai.OpenAI(
             api_key=OPENAI_API_KEY,
-            timeout=30.0
+            timeout=30.0,
+            max_retries=OPENAI_MAX_RETRIES  # SDK backs off exponentially and honors Retry-After on 429/5xx/timeouts
         )
         self.model = "gpt-4o-mini"
+        self.embedding_model = "text-embedding-3-small"
+    
+    def warm_up(self):
+        """
+        Open a pooled connection to OpenAI in the background (DNS + TLS handshake),
+        so the first classification doesn't pay for it.
+        """
+        threading.Thread(target=self._warmup, daemon=True).start()
+    
+    def _warmup(self):
+        try:
+            self.client.models.retrieve(self.model)
+            logger.debug("OpenAI connection warmed up")
+        except Exception as e:
+            logger.debug("OpenAI warmup failed: %s", e)
     
-    def classify_industry(self, company_data: Dict[str, Any]) -> str:
+    def _embed_company(self, company_data: Dict[str, Any]) -> Optional[List[float]]:
         """
-        Stage 1: Analyze company to determine vertical for personalization
+        Embed the descriptive fields of a company for semantic cache lookups.
+        Returns None if there is too little text to compare or the call fails.
         """
+        description = company_data.get('description') or ''
+        keywords = company_data.get('keywords') or []
+        if not description and not keywords:
+            return None
+        
+        canonical_text = f"{company_data.get('industry', '')}. {description}. {' '.join(keywords)}"
+        
+        try:
+            response = self.client.embeddings.create(
+                model=self.embedding_model,
+                input=canonical_text
+            )
+            return response.data[0].embedding
+        except Exception as e:
+            logger.warning("Embedding error, skipping semantic cache: %s", e)
+            return None
+    
+    def classify_industry(self, company_data: Dict[str, Any], bypass_cache: bool = False) -> str:
+        """
+        Stage 1: Analyze company to determine vertical for personalization.
+        Served from the persistent and semantic classification caches unless
+        bypass_cache is set (a fresh result is still written to the persistent cache).
+        """
+        cache_key = make_key('classify', json.dumps(company_data, sort_keys=True, default=str))
+        if not bypass_cache:
+            cached = _classify_cache.get(cache_key)
+            if cached is not None:
+                logger.info("Stage 1 cached - Vertical: %s", cached)
+                return cached
+        
+        # Bypassing calls don't join a cached lookup already in flight
+        inflight_key = f"{cache_key}:fresh" if bypass_cache else cache_key
+        return _inflight.do(inflight_key, lambda: self._classify_industry(company_data, cache_key, bypass_cache))
+    
+    def _classify_industry(self, company_data: Dict[str, Any], cache_key: str,
+                           bypass_cache: bool = False) -> str:
         logger.info(f"Stage 1: Analyzing company - {company_data.get('name')}")
         
+        # Check semantic cache before calling the LLM (no embedding round-trip when bypassing it)
+        embedding = None if bypass_cache else self._embed_company(company_data)
+        if embedding:
+            cached_vertical = _vertical_cache.lookup(embedding)
+            if cached_vertical:
+                # Approximate hit: not persisted, the exact-match cache only stores LLM answers
+                return cached_vertical
+        
         # Format keywords for the prompt
         keywords_str = ", ".join(company_data.get('keywords', [])[:10]) if company_data.get('keywords') else "None"
         
-        prompt = f"""Analyze company data to determine applicable vertical for ScOp VC's cold emails.
-
-Company: {company_data.get('name')}
+        user_message = f"""Company: {company_data.get('name')}
 Location: {company_data.get('location')}
 Industry: {company_data.get('industry')}
 Description: {company_data.get('description', '')}
-Keywords: {keywords_str}
-
-Return ONLY a JSON object:
-{{
-  "vertical": "string or null"
-}}
-
-Vertical must be ONE of: "Financial Services", "Construction", "Proptech", "AI Infrastructure", "HealthTech", "Vertical SaaS", or null
-
-RULES:
-- HealthTech: healthcare, hospitals, clinical, medical, patient care, surgery centers, healthcare operations
-- Financial Services: fintech, banking, payments, lending, insurance, accounting
-- Construction: construction tech, contractors, building, BIM, project management for construction
-- Proptech: property management, real estate tech, facility management (NOT construction)
-- AI Infrastructure: LLM, vector databases, AI/ML ops, foundation models, knowledge graphs
-- Vertical SaaS: Any B2B SaaS targeting specific industry not above
-- null: if unclear or consumer software
-
-Return ONLY the JSON, no markdown or explanation."""
+Keywords: {keywords_str}"""
 
         try:
             response = self.client.chat.completions.create(
                 model=self.model,
-                messages=[{"role": "user", "content": prompt}],
+                messages=[
+                    # Static instructions as the system message, per-company data as the user message
+                    {"role": "system", "content": CLASSIFIER_SYSTEM_PROMPT},
+                    {"role": "user", "content": user_message}
+                ],
                 temperature=0,
-                max_tokens=50,
-                seed=42
+                max_tokens=10,
+                seed=42,
+                response_format=VERTICAL_RESPONSE_FORMAT
             )
             
-            raw_content = response.choices[0].message.content.strip()
-            # Clean markdown
-            if raw_content.startswith('```'):
-                raw_content = raw_content.split('```')[1].strip()
-                if raw_content.startswith('json'):
-                    raw_content = raw_content[4:].strip()
+            usage = getattr(response, 'usage', None)
+            details = getattr(usage, 'prompt_tokens_details', None)
+            if details is not None:
+                logger.debug("Stage 1 prompt tokens: %d (%d cached)", usage.prompt_tokens, details.cached_tokens)
             
-            result = json.loads(raw_content)
-            vertical = result.get('vertical')
+            result = json.loads(response.choices[0].message.content)
+            vertical = VERTICAL_LABELS.get(result.get('vertical'))
             
             logger.info(f"Stage 1 complete - Vertical: {vertical}")
+            if embedding:
+                _vertical_cache.add(embedding, vertical or "Other")
+            # Errors below fall back to "Other" without caching, so they are retried next run
+            _classify_cache.set(cache_key, vertical or "Other")
             return vertical or "Other"
             
         except Exception as e:
@@ -80,38 +293,50 @@ Return ONLY the JSON, no markdown or explanation."""
         """
         Stage 2: Generate email using exact deterministic templates
         """
+        return self.generate_emails(company_data, [founder_data], industry, owner)[0]
+    
+    def generate_emails(self, company_data: Dict[str, Any], founders: List[Dict[str, Any]],
+                        industry: str, owner: str) -> List[str]:
+        """
+        Stage 2 for all founders of one company. Company, location and owner
+        parts are resolved once and shared by every founder's email.
+        
+        Returns:
+            One email per founder, in founder order
+        """
         company_name = company_data.get('name', 'Unknown')
-        founder_first_name = founder_data.get('first_name', 'Unknown')
         location = company_data.get('location', '')
         
         # Extract location if it matches
-        location_match = None
-        if location:
-            if 'New York' in location or 'New York' in location:
-                location_match = 'New York'
-            elif any(city in location for city in ['Los Angeles', 'San Diego', 'Santa Barbara', 'San Luis Obispo']):
-                location_match = 'Southern California'
+        location_match = next(
+            (bucket for bucket, pattern in LOCATION_PATTERNS if pattern.search(location or '')), None
+        )
         
         # Get owner info
-        owner_name = owner.split('@')[0] if '@' in owner else owner
-        calendly_link = CALENDLY_LINKS.get(owner_name, '')
-        sender_name = owner_name.capitalize()
+        owner_info = OWNER_TABLE.get(owner)
+        if owner_info is None:
+            owner_name = owner.split('@', 1)[0]
+            owner_info = (owner_name.capitalize(), CALENDLY_LINKS.get(owner_name, ''))
+        sender_name, calendly_link = owner_info
         
-        logger.info(f"Stage 2: Generating email for {founder_first_name} at {company_name}")
+        logger.info("Stage 2: Generating %d email(s) for %s", len(founders), company_name)
         logger.info(f"  Industry: {industry}, Location: {location_match}, Owner: {sender_name}")
         
-        # Build the email using exact templates
-        email = self._build_email_from_template(
-            company_name=company_name,
-            founder_first_name=founder_first_name,
-            vertical=industry,
-            location=location_match,
-            calendly_link=calendly_link,
-            sender_name=sender_name
-        )
+        # Build the emails using exact templates
+        emails = [
+            self._build_email_from_template(
+                company_name=company_name,
+                founder_first_name=founder_data.get('first_name', 'Unknown'),
+                vertical=industry,
+                location=location_match,
+                calendly_link=calendly_link,
+                sender_name=sender_name
+            )
+            for founder_data in founders
+        ]
         
-        logger.info("Stage 2 complete - Email generated")
-        return email
+        logger.info("Stage 2 complete - Emails generated")
+        return emails
     
     def _build_email_from_template(self, company_name, founder_first_name, vertical, location, 
                                    calendly_link, sender_name):
@@ -121,41 +346,14 @@ Return ONLY the JSON, no markdown or explanation."""
         # Stage 1: Greeting
         greeting = f"Hi {founder_first_name}," if founder_first_name and founder_first_name != 'Unknown' else "Hi there,"
         
-        # Stage 2: Build opening paragraph with vertical-specific content
-        opening = "I just came across you guys and wanted to introduce our fund, ScOp Venture Capital - our team all comes from operating backgrounds in software, and we lead pre-seed through Series A rounds in vertical software and AI."
-        
-        # Add vertical-specific content
-        vertical_additions = {
-            "Financial Services": "We have experience with companies in financial services - our portfolio company Rogo raised a $50m Series B from Thrive building a full AI suite for banks and large financial institutions.",
-            "Construction": "We have deep experience and network in construction - our partner Kevin wrote the first check to Procore, and we have the CEO and lots of early Procore employees as LPs.",
-            "Proptech": "We have strong experience in proptech, and have the founders of Appfolio and Procore as LPs.",
-            "AI Infrastructure": "Our partners Kevin and Ivan built and sold the knowledge graph software that powered Amazon Alexa, and we have founders of MongoDB, Twilio, DoubleClick, and more as LPs.",
-            "HealthTech": "We have some experience in healthcare - our portfolio includes a patient communications company, an RCM platform, and a consumer health tracking app.",
-            "Vertical SaaS": "Our partner Kevin founded DoubleClick (sold to Google), and Graphiq (sold to Amazon) - we have the founders of Procore, Appfolio, MongoDB, Twilio, and more as LPs.",
-        }
-        
-        if vertical in vertical_additions:
-            opening += " " + vertical_additions[vertical]
-        
-        # Add location-specific content
-        location_additions = {
-            "New York": "We have several portcos in New York as well (Rogo, Promptlayer, Pangram Labs, SuiteOp).",
-            "Southern California": "We're based in Santa Barbara and have pretty good local coverage and network throughout SoCal.",
-        }
-        
-        if location in location_additions:
-            opening += " " + location_additions[location]
-        
-        # Stage 3: Company interest
-        company_interest = f"{company_name} looks really interesting, I would love to learn more about the business and what you've built."
-        
-        # Stage 4: CTA
-        cta = f"Any times work to chat in the next few weeks? {calendly_link}"
-        
-        # Stage 5: Sign-off
-        sign_off = f"All the best!\n\n{sender_name}"
+        # Stage 2: Opening paragraph with vertical/location content (precomputed)
+        opening = EMAIL_OPENINGS.get((vertical, location)) or EMAIL_OPENINGS[(None, location)]
         
-        # Assemble the email
-        email = f"{greeting}\n\n{opening}\n\n{company_interest}\n\n{cta}\n\n{sign_off}"
-        
-        return email
+        # Stages 3-5: Company interest, CTA and sign-off
+        return EMAIL_TEMPLATE.format(
+            greeting=greeting,
+            opening=opening,
+            company_name=company_name,
+            calendly_link=calendly_link,
+            sender_name=sender_name
+        )
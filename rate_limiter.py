@@ -0,0 +1,33 @@
+import threading
+import time
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket. Allows bursts up to `rate` calls, refilling at
+    `rate` tokens per `period` seconds. A rate of 0 disables limiting.
+    """
+
+    def __init__(self, rate: int, period: float = 60.0):
+        self.rate = rate
+        self.period = period
+        self._tokens = float(rate)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """
+        Block until a call is allowed.
+        """
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.rate, self._tokens + (now - self._updated) * self.rate / self.period)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) * self.period / self.rate
+            time.sleep(wait)
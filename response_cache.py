@@ -0,0 +1,98 @@
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+from serialization import dumps, loads
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseCache:
+    """
+    Two-tier key/value cache with per-entry expiry for API responses: an
+    in-process LRU in front of a SQLite file. Values are stored as JSON, so
+    every hit returns a fresh object that callers may mutate.
+    If the database can't be opened (e.g. read-only filesystem), only the
+    in-process tier is used.
+    """
+
+    def __init__(self, path: str, ttl_seconds: int, memory_size: int = 4096):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.memory_size = memory_size
+        self._memory: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()  # key -> (expires_at, JSON)
+        self._lock = threading.Lock()
+        self._conn = None
+        self._disabled = not path
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        # Called with self._lock held
+        if self._conn is None and not self._disabled:
+            try:
+                conn = sqlite3.connect(self.path, check_same_thread=False)
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+                )
+                conn.commit()
+                self._conn = conn
+            except sqlite3.Error as e:
+                logger.warning("Response cache disabled, could not open %s: %s", self.path, e)
+                self._disabled = True
+        return self._conn
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Return the cached value for key, or None if missing or expired.
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._memory.move_to_end(key)
+                    return loads(entry[1])
+                del self._memory[key]
+            
+            conn = self._connect()
+            if conn is None:
+                return None
+            try:
+                row = conn.execute(
+                    "SELECT value, expires_at FROM cache WHERE key = ? AND expires_at > ?", (key, now)
+                ).fetchone()
+            except sqlite3.Error as e:
+                logger.warning("Response cache read error: %s", e)
+                return None
+            if row is None:
+                return None
+            self._remember(key, row[0], row[1])
+        return loads(row[0])
+
+    def set(self, key: str, value: Any, ttl_seconds: Optional[int] = None):
+        """
+        Store value under key for ttl_seconds (defaults to the cache TTL).
+        """
+        expires_at = time.time() + (ttl_seconds or self.ttl_seconds)
+        payload = dumps(value)
+        with self._lock:
+            self._remember(key, payload, expires_at)
+            conn = self._connect()
+            if conn is None:
+                return
+            try:
+                conn.execute(
+                    "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+                    (key, payload, expires_at)
+                )
+                conn.commit()
+            except sqlite3.Error as e:
+                logger.warning("Response cache write error: %s", e)
+
+    def _remember(self, key: str, payload: bytes, expires_at: float):
+        # Called with self._lock held
+        self._memory[key] = (expires_at, payload)
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
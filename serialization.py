@@ -0,0 +1,34 @@
+import importlib
+import json
+from typing import Any
+
+
+def _select_loads():
+    """
+    Pick the fastest installed JSON decoder once at import (orjson -> simdjson -> ujson -> stdlib).
+    All of them accept str or bytes and raise ValueError on bad input.
+    """
+    for name in ('orjson', 'simdjson', 'ujson'):
+        try:
+            return importlib.import_module(name).loads
+        except ImportError:
+            continue
+    return json.loads
+
+
+loads = _select_loads()
+
+try:
+    import orjson
+
+    def dumps(obj: Any) -> bytes:
+        """
+        Serialize obj to compact UTF-8 JSON bytes.
+        """
+        return orjson.dumps(obj)
+except ImportError:
+    def dumps(obj: Any) -> bytes:
+        """
+        Serialize obj to compact UTF-8 JSON bytes.
+        """
+        return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode()
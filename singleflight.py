@@ -0,0 +1,61 @@
+import copy
+import hashlib
+import logging
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict
+
+logger = logging.getLogger(__name__)
+
+
+def make_key(*parts: Any) -> str:
+    """
+    Build a stable request key from an endpoint name and its arguments.
+    """
+    return hashlib.sha256('\x1f'.join(str(part) for part in parts).encode()).hexdigest()
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent identical calls (request coalescing).
+    While a call for a key is in flight, other callers with the same key wait
+    for that call and share its result instead of issuing their own request.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._inflight: Dict[str, Future] = {}
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        """
+        Run fn() unless an identical call is already in flight, in which case wait for it.
+
+        Args:
+            key: Request key (see make_key)
+            fn: Zero-argument callable performing the actual call
+
+        Returns:
+            The call's result. Waiting callers get a shallow copy so they can
+            safely mutate returned dicts.
+        """
+        with self._lock:
+            future = self._inflight.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = Future()
+                self._inflight[key] = future
+
+        if not is_leader:
+            logger.debug("Coalescing with in-flight call %s", key[:12])
+            return copy.copy(future.result())
+
+        try:
+            result = fn()
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                del self._inflight[key]
@@ -1,10 +1,151 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
-from typing import Dict, List, Any, Optional
-from config import SPECTER_API_KEY, SPECTER_BASE_URL
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Tuple
+from config import (
+    SPECTER_API_KEY, SPECTER_BASE_URL, SPECTER_MAX_RETRIES, SPECTER_CACHE_PATH, SPECTER_CACHE_TTL,
+    SPECTER_RATE_LIMIT_PER_MINUTE, SPECTER_POLL_MAX_WAIT
+)
+from rate_limiter import RateLimiter
+from response_cache import ResponseCache
+from serialization import loads as _loads
+from singleflight import SingleFlight, make_key
 
 logger = logging.getLogger(__name__)
 
+# Local TTL cache of Specter lookups (companies, people and emails change slowly)
+_cache = ResponseCache(SPECTER_CACHE_PATH, SPECTER_CACHE_TTL)
+
+# Shared across SpecterClient instances so concurrent requests coalesce identical lookups
+_inflight = SingleFlight()
+
+# Process-wide limit on Specter requests per minute
+_rate_limiter = RateLimiter(SPECTER_RATE_LIMIT_PER_MINUTE)
+
+# Max pooled connections to Specter (also caps concurrent founder lookups)
+SESSION_POOL_SIZE = 32
+
+# Transient statuses worth retrying (rate limited / upstream unavailable)
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# Seconds between polls while Specter is still enriching a person (202 Accepted)
+POLL_INTERVAL = 2.0
+
+# Longest Retry-After (seconds) slept before a retry, so a throttled request can't stall /enrich
+RETRY_AFTER_MAX = 5.0
+
+
+def _format_location(hq: Any) -> str:
+    """
+    Format Specter's hq object as "City, Region" ('Unknown' when absent).
+    """
+    if not isinstance(hq, dict):
+        return 'Unknown'
+    return ', '.join(part for part in (hq.get('city'), hq.get('region')) if part) or 'Unknown'
+
+
+def _linkedin_url(socials: Any) -> str:
+    """
+    Extract the company LinkedIn URL from Specter's socials object.
+    """
+    linkedin = socials.get('linkedin') if isinstance(socials, dict) else None
+    if isinstance(linkedin, dict):
+        url = linkedin.get('url') or ''
+        return f"https://{url}" if url and not url.startswith('http') else url
+    return str(linkedin) if linkedin else ''
+
+
+def _parse_company(data: Dict[str, Any], domain: str) -> Dict[str, Any]:
+    """
+    Shape a raw Specter company record into the company_data dict used by the pipeline.
+    """
+    industries = data.get('industries') or []
+    
+    return {
+        'id': data.get('id'),
+        'name': data.get('organization_name', 'Unknown'),
+        'domain': data.get('website', domain),
+        'description': data.get('description', ''),
+        'short_description': data.get('tagline', ''),
+        'keywords': data.get('tags', []),
+        'industry': industries[0] if industries else 'Unknown',
+        'location': _format_location(data.get('hq')),
+        'employee_count': data.get('employee_count', 0),
+        'linkedin_url': _linkedin_url(data.get('socials')),
+        'website_url': data.get('website', ''),
+        'founded_year': data.get('founded_year'),
+        'founder_info': data.get('founder_info') or [],
+        'investors': data.get('investors') or [],
+        'investor_count': data.get('investor_count', 0)
+    }
+
+
+def _parse_person(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Shape a raw Specter person record into the person_data dict used by the pipeline.
+    """
+    return {
+        'person_id': data.get('person_id'),
+        'first_name': data.get('first_name', ''),
+        'last_name': data.get('last_name', ''),
+        'full_name': data.get('full_name', 'Unknown'),
+        'title': data.get('current_position_title', ''),
+        'linkedin_url': data.get('linkedin_url', ''),
+        'location': data.get('location', ''),
+        'about': data.get('about', ''),
+        'tagline': data.get('tagline', ''),
+        'profile_picture_url': data.get('profile_picture_url'),
+        'twitter_url': data.get('twitter_url'),
+        'github_url': data.get('github_url'),
+        'highlights': data.get('highlights', []),
+        'skills': data.get('skills', []),
+    }
+
+
+def split_full_name(full_name: str) -> Tuple[str, str]:
+    """
+    Split a full name into (first name, rest), for founders known only by name.
+    """
+    parts = (full_name or '').split()
+    return (parts[0] if parts else '', ' '.join(parts[1:]))
+
+
+def _build_partial_founder(founder: Dict[str, Any], email: Optional[str]) -> Dict[str, Any]:
+    """
+    Build founder data from the founder_info entry alone (person lookup pending/failed).
+    """
+    first_name, last_name = split_full_name(founder.get('full_name'))
+    
+    return {
+        'person_id': founder.get('specter_person_id'),
+        'full_name': founder.get('full_name', 'Unknown'),
+        'first_name': first_name,
+        'last_name': last_name,
+        'title': founder.get('title', ''),
+        'email': email,
+        'linkedin_url': '',
+        'status': 'pending'
+    }
+
+
+class _RateLimitedRetry(Retry):
+    """
+    urllib3 Retry that takes a rate limiter token before every retry attempt, so
+    retries count against the process-wide Specter budget, and caps Retry-After.
+    """
+    
+    def get_retry_after(self, response) -> Optional[float]:
+        retry_after = super().get_retry_after(response)
+        return None if retry_after is None else min(retry_after, RETRY_AFTER_MAX)
+    
+    def sleep(self, response=None):
+        super().sleep(response)
+        _rate_limiter.acquire()
+
 
 class SpecterClient:
     def __init__(self):
@@ -15,22 +156,97 @@ class SpecterClient:
             'Content-Type': 'application/json',
             'X-API-Key': self.api_key
         }
+        
+        # Persistent session so keep-alive reuses one TCP+TLS connection across calls.
+        # Pool is sized for the concurrent founder fan-out. Transient failures (429/5xx,
+        # connection errors) are retried by the adapter with exponential backoff, honoring
+        # Retry-After up to RETRY_AFTER_MAX and taking a rate limiter token per attempt;
+        # the last response is returned as-is once retries run out.
+        retry = _RateLimitedRetry(
+            total=SPECTER_MAX_RETRIES,
+            status_forcelist=RETRY_STATUS_CODES,
+            backoff_factor=0.5,
+            respect_retry_after_header=True,
+            allowed_methods=frozenset(['GET', 'POST']),
+            raise_on_status=False
+        )
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=SESSION_POOL_SIZE, max_retries=retry))
+        
+        # Endpoint URLs, built once per client
+        self._companies_url = f"{self.base_url}/companies"
+        self._people_url = f"{self.base_url}/people"
+        self._person_url = f"{self.base_url}/people/%s"
+        self._email_url = f"{self.base_url}/people/%s/email"
+    
+    def warm_up(self):
+        """
+        Open a pooled connection to Specter in the background (DNS + TLS handshake),
+        so the first real request doesn't pay for it.
+        """
+        threading.Thread(target=self._warmup, daemon=True).start()
+    
+    def _warmup(self):
+        try:
+            self.session.head(self.base_url, timeout=2)
+            logger.debug("Specter connection warmed up")
+        except requests.exceptions.RequestException as e:
+            logger.debug("Specter warmup failed: %s", e)
+    
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Send a request to Specter through the process-wide rate limiter.
+        Retries happen in the session's adapter, each taking its own token.
+        """
+        _rate_limiter.acquire()
+        response = self.session.request(method, url, **kwargs)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Specter %s %s: %s bytes on wire (%s), %d decoded",
+                method, url, response.headers.get('Content-Length', '?'),
+                response.headers.get('Content-Encoding', 'identity'), len(response.content)
+            )
+        return response
     
-    def get_company_by_domain(self, domain: str) -> Optional[Dict[str, Any]]:
+    def _poll_until_ready(self, url: str, max_wait: float = SPECTER_POLL_MAX_WAIT,
+                          interval: float = POLL_INTERVAL, **kwargs) -> requests.Response:
+        """
+        GET url, re-polling while Specter answers 202 Accepted (enrichment in progress)
+        so callers see a terminal response. Gives up after max_wait seconds and
+        returns the last 202 response.
+        """
+        deadline = time.monotonic() + max_wait
+        while True:
+            response = self._request('GET', url, **kwargs)
+            if response.status_code != 202 or time.monotonic() + interval > deadline:
+                return response
+            logger.info("Specter enrichment in progress, polling again in %.0fs: %s", interval, url)
+            time.sleep(interval)
+    
+    def get_company_by_domain(self, domain: str, bypass_cache: bool = False) -> Optional[Dict[str, Any]]:
         """
         Get company info by domain using Specter enrichment API.
         Returns company data including founder_info array.
+        Results are served from the local cache unless bypass_cache is set.
         """
-        url = f"{self.base_url}/companies"
+        url = self._companies_url
         payload = {"domain": domain}
+        cache_key = f"company:{domain}"
         
-        logger.info(f"Step 0: Getting company info for domain: {domain}")
+        logger.info("Step 0: Getting company info for domain: %s", domain)
+        
+        if not bypass_cache:
+            cached = _cache.get(cache_key)
+            if cached is not None:
+                logger.info("Company data retrieved from cache: %s", cached['name'])
+                return cached
         
         try:
-            response = requests.post(url, headers=self.headers, json=payload)
+            response = self._request('POST', url, json=payload)
             response.raise_for_status()
             
-            data = response.json()
+            data = _loads(response.content)
             
             # Handle case where API returns a list of companies
             if isinstance(data, list):
@@ -38,101 +254,75 @@ class SpecterClient:
                     logger.warning("Specter API returned empty list")
                     return None
                 data = data[0]  # Take first matching company
-                logger.info(f"Specter returned list, using first result")
+                logger.info("Specter returned list, using first result")
             
             # Debug: log available fields (set to debug level for production)
-            logger.debug(f"Specter company fields: {list(data.keys())}")
-            
-            # Extract location from hq object
-            hq = data.get('hq', {})
-            location = hq.get('city', '') if isinstance(hq, dict) else 'Unknown'
-            if isinstance(hq, dict) and hq.get('region'):
-                location = f"{location}, {hq.get('region')}" if location else hq.get('region')
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Specter company fields: %s", list(data.keys()))
             
-            # Extract LinkedIn from socials
-            socials = data.get('socials', {})
-            linkedin_data = socials.get('linkedin', {}) if isinstance(socials, dict) else {}
-            if isinstance(linkedin_data, dict):
-                linkedin_url = linkedin_data.get('url', '')
-                if linkedin_url and not linkedin_url.startswith('http'):
-                    linkedin_url = f"https://{linkedin_url}"
-            else:
-                linkedin_url = str(linkedin_data) if linkedin_data else ''
-            
-            # Extract industries
-            industries = data.get('industries', [])
-            industry = industries[0] if industries else 'Unknown'
-            
-            company_data = {
-                'id': data.get('id'),
-                'name': data.get('organization_name', 'Unknown'),
-                'domain': data.get('website', domain),
-                'description': data.get('description', ''),
-                'short_description': data.get('tagline', ''),
-                'keywords': data.get('tags', []),
-                'industry': industry,
-                'location': location or 'Unknown',
-                'employee_count': data.get('employee_count', 0),
-                'linkedin_url': linkedin_url,
-                'website_url': data.get('website', ''),
-                'founded_year': data.get('founded_year'),
-                'founder_info': data.get('founder_info') or [],
-                'investors': data.get('investors') or [],
-                'investor_count': data.get('investor_count', 0)
-            }
+            company_data = _parse_company(data, domain)
             
-            logger.info(f"Company data retrieved: {company_data['name']}")
-            logger.info(f"Found {len(company_data['founder_info'])} founders in company data")
-            logger.info(f"Found {len(company_data['investors'])} investors in company data")
+            logger.info("Company data retrieved: %s", company_data['name'])
+            logger.info("Found %d founders in company data", len(company_data['founder_info']))
+            logger.info("Found %d investors in company data", len(company_data['investors']))
+            _cache.set(cache_key, company_data)
             return company_data
             
         except requests.exceptions.RequestException as e:
-            logger.error(f"Specter API error for company search: {e}")
+            logger.error("Specter API error for company search: %s", e)
+            return None
+        except ValueError as e:
+            logger.warning("Specter: Invalid response for company search: %s", e)
             return None
     
-    def get_person(self, person_id: str) -> Optional[Dict[str, Any]]:
+    def get_person(self, person_id: str, bypass_cache: bool = False,
+                   max_wait: float = SPECTER_POLL_MAX_WAIT) -> Optional[Dict[str, Any]]:
         """
         Get person profile by Specter person ID.
         Returns full person profile with name, title, linkedin, etc.
+        Served from the local cache unless bypass_cache is set; concurrent
+        lookups of the same person share one API call. A 202 is re-polled for
+        up to max_wait seconds before the person is reported pending.
         """
-        url = f"{self.base_url}/people/{person_id}"
+        cache_key = f"person:{person_id}"
+        if not bypass_cache:
+            cached = _cache.get(cache_key)
+            if cached is not None:
+                logger.info("Person data retrieved from cache: %s", cached['full_name'])
+                return cached
+        
+        person_data = _inflight.do(make_key('person', person_id), lambda: self._get_person(person_id, max_wait))
         
-        logger.info(f"Getting person details for ID: {person_id}")
+        # Pending (202) results are not cached so the next call retries
+        if person_data and person_data.get('status') != 'pending':
+            _cache.set(cache_key, person_data)
+        return person_data
+    
+    def _get_person(self, person_id: str, max_wait: float) -> Optional[Dict[str, Any]]:
+        url = self._person_url % person_id
+        
+        logger.info("Getting person details for ID: %s", person_id)
         
         try:
-            response = requests.get(url, headers=self.headers)
+            response = self._poll_until_ready(url, max_wait)
             
-            # Handle 202 Accepted (async enrichment in progress)
+            # Still 202 Accepted after polling (async enrichment in progress)
             if response.status_code == 202:
-                logger.warning(f"Person {person_id} enrichment in progress (202 Accepted)")
+                logger.warning("Person %s enrichment in progress (202 Accepted)", person_id)
                 return {'status': 'pending', 'person_id': person_id}
             
             response.raise_for_status()
             
-            data = response.json()
-            
-            person_data = {
-                'person_id': data.get('person_id'),
-                'first_name': data.get('first_name', ''),
-                'last_name': data.get('last_name', ''),
-                'full_name': data.get('full_name', 'Unknown'),
-                'title': data.get('current_position_title', ''),
-                'linkedin_url': data.get('linkedin_url', ''),
-                'location': data.get('location', ''),
-                'about': data.get('about', ''),
-                'tagline': data.get('tagline', ''),
-                'profile_picture_url': data.get('profile_picture_url'),
-                'twitter_url': data.get('twitter_url'),
-                'github_url': data.get('github_url'),
-                'highlights': data.get('highlights', []),
-                'skills': data.get('skills', []),
-            }
+            person_data = _parse_person(_loads(response.content))
             
-            logger.info(f"Person data retrieved: {person_data['full_name']}")
+            logger.info("Person data retrieved: %s", person_data['full_name'])
             return person_data
             
         except requests.exceptions.RequestException as e:
-            logger.error(f"Specter API error for person lookup: {e}")
+            logger.error("Specter API error for person lookup: %s", e)
+            return None
+        except ValueError as e:
+            logger.warning("Specter: Invalid response for person lookup: %s", e)
             return None
     
     def lookup_person_by_linkedin(self, linkedin_url: str) -> Optional[Dict[str, Any]]:
@@ -150,36 +340,36 @@ class SpecterClient:
         if not linkedin_url:
             return None
             
-        url = f"{self.base_url}/people"
+        url = self._people_url
         payload = {"linkedin_url": linkedin_url}
         
-        logger.info(f"Specter: Looking up person by LinkedIn: {linkedin_url}")
+        logger.info("Specter: Looking up person by LinkedIn: %s", linkedin_url)
         
         try:
-            response = requests.post(url, headers=self.headers, json=payload)
+            response = self._request('POST', url, json=payload)
             
             # Handle 202 Accepted (async enrichment in progress)
             if response.status_code == 202:
-                data = response.json() if response.text else {}
+                data = _loads(response.content) if response.content else {}
                 person_id = data.get('person_id')
                 if person_id:
-                    logger.info(f"Specter: Person enrichment pending, got ID: {person_id}")
+                    logger.info("Specter: Person enrichment pending, got ID: %s", person_id)
                     return {'person_id': person_id, 'status': 'pending'}
-                logger.warning(f"Specter: Person enrichment pending (202), no ID returned")
+                logger.warning("Specter: Person enrichment pending (202), no ID returned")
                 return None
             
             response.raise_for_status()
             
             # Handle empty response
-            if not response.text or not response.text.strip():
-                logger.warning(f"Specter: Empty response for LinkedIn lookup")
+            if not response.content.strip():
+                logger.warning("Specter: Empty response for LinkedIn lookup")
                 return None
             
-            data = response.json()
+            data = _loads(response.content)
             
             person_id = data.get('person_id')
             if not person_id:
-                logger.warning(f"Specter: No person_id in response")
+                logger.warning("Specter: No person_id in response")
                 return None
             
             person_data = {
@@ -192,68 +382,89 @@ class SpecterClient:
                 'status': 'found'
             }
             
-            logger.info(f"Specter: Found person {person_data['full_name']} (ID: {person_id})")
+            logger.info("Specter: Found person %s (ID: %s)", person_data['full_name'], person_id)
             return person_data
             
         except requests.exceptions.RequestException as e:
-            logger.error(f"Specter API error for LinkedIn lookup: {e}")
+            logger.error("Specter API error for LinkedIn lookup: %s", e)
             return None
         except (ValueError, KeyError) as e:
-            logger.warning(f"Specter: Invalid response for LinkedIn lookup: {e}")
+            logger.warning("Specter: Invalid response for LinkedIn lookup: %s", e)
             return None
     
-    def get_person_email(self, person_id: str, email_type: str = "professional") -> Optional[str]:
+    def get_person_email(self, person_id: str, email_type: str = "professional",
+                         bypass_cache: bool = False, max_wait: float = SPECTER_POLL_MAX_WAIT) -> Optional[str]:
         """
         Get person's email by Specter person ID.
         
         Args:
             person_id: The Specter person ID
             email_type: 'professional' or 'personal' (defaults to professional)
+            bypass_cache: Skip the local cache and force a fresh lookup
+            max_wait: Seconds to keep re-polling a 202 before giving up
         
         Returns:
             Email address string or None if not found
         """
-        url = f"{self.base_url}/people/{person_id}/email"
+        cache_key = f"email:{person_id}:{email_type}"
+        if not bypass_cache:
+            cached = _cache.get(cache_key)
+            if cached is not None:
+                logger.info("Email retrieved from cache: %s", cached)
+                return cached
+        
+        email = _inflight.do(
+            make_key('email', person_id, email_type),
+            lambda: self._get_person_email(person_id, email_type, max_wait)
+        )
+        
+        # Misses are not cached; the email may still be in enrichment
+        if email:
+            _cache.set(cache_key, email)
+        return email
+    
+    def _get_person_email(self, person_id: str, email_type: str, max_wait: float) -> Optional[str]:
+        url = self._email_url % person_id
         params = {"type": email_type}
         
-        logger.info(f"Getting {email_type} email for person ID: {person_id}")
+        logger.info("Getting %s email for person ID: %s", email_type, person_id)
         
         try:
-            response = requests.get(url, headers=self.headers, params=params)
+            response = self._poll_until_ready(url, max_wait, params=params)
             
-            # Handle 202 Accepted (async enrichment in progress)
+            # Still 202 Accepted after polling (async enrichment in progress)
             if response.status_code == 202:
-                logger.warning(f"Email enrichment in progress for {person_id} (202 Accepted)")
+                logger.warning("Email enrichment in progress for %s (202 Accepted)", person_id)
                 return None
             
             # Handle 404 - email not found
             if response.status_code == 404:
-                logger.warning(f"No {email_type} email found for person {person_id}")
+                logger.warning("No %s email found for person %s", email_type, person_id)
                 return None
             
             response.raise_for_status()
             
             # Handle empty response body
-            if not response.text or not response.text.strip():
-                logger.warning(f"Empty response body for email lookup: {person_id}")
+            if not response.content.strip():
+                logger.warning("Empty response body for email lookup: %s", person_id)
                 return None
             
-            data = response.json()
+            data = _loads(response.content)
             email = data.get('email')
             returned_type = data.get('type', email_type)
             
             if email:
-                logger.info(f"Email retrieved: {email} (type: {returned_type})")
+                logger.info("Email retrieved: %s (type: %s)", email, returned_type)
             else:
-                logger.warning(f"No email in response for person {person_id}")
+                logger.warning("No email in response for person %s", person_id)
             
             return email
             
         except requests.exceptions.RequestException as e:
-            logger.error(f"Specter API error for email lookup: {e}")
+            logger.error("Specter API error for email lookup: %s", e)
             return None
         except (ValueError, KeyError) as e:
-            logger.warning(f"Invalid response from Specter email API for {person_id}: {e}")
+            logger.warning("Invalid response from Specter email API for %s: %s", person_id, e)
             return None
     
     def get_founders(self, domain: str) -> List[Dict[str, Any]]:
@@ -270,39 +481,56 @@ class SpecterClient:
             logger.info("No founders found in company data")
             return []
         
-        logger.info(f"Enriching {len(founder_info)} founders")
+        unique_ids = {f.get('specter_person_id') for f in founder_info if f.get('specter_person_id')}
+        logger.info("Enriching %d founders (%d unique person IDs)", len(founder_info), len(unique_ids))
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(2 * len(unique_ids), SESSION_POOL_SIZE))) as executor:
+            lookups = self._submit_founder_lookups(executor, founder_info)
+            return [
+                self._merge_founder(founder, person_future.result(), email_future.result())
+                for founder, person_future, email_future in lookups
+            ]
+    
+    def _submit_founder_lookups(self, executor: ThreadPoolExecutor, founder_info: List[Dict[str, Any]]) -> List[Tuple[Dict[str, Any], Future, Future]]:
+        """
+        Submit the person and email lookups for every founder to one pool, so all
+        2N requests are in flight at once over the shared session.
+        Founders without a Specter person ID are skipped; founders sharing a person ID
+        (e.g. listed once per role) share one pair of lookups.
         
-        enriched_founders = []
+        Returns:
+            List of (founder, person_future, email_future) in founder order
+        """
+        lookups = []
+        futures_by_id = {}
         for founder in founder_info:
             person_id = founder.get('specter_person_id')
             if not person_id:
-                logger.warning(f"No person ID for founder: {founder.get('full_name', 'Unknown')}")
+                logger.warning("No person ID for founder: %s", founder.get('full_name', 'Unknown'))
                 continue
+            if person_id not in futures_by_id:
+                futures_by_id[person_id] = (
+                    executor.submit(self.get_person, person_id),
+                    executor.submit(self.get_person_email, person_id)
+                )
+            lookups.append((founder, *futures_by_id[person_id]))
+        return lookups
+    
+    def _merge_founder(self, founder: Dict[str, Any], person_data: Optional[Dict[str, Any]],
+                       email: Optional[str]) -> Dict[str, Any]:
+        """
+        Combine a founder_info entry with its person lookup and email.
+        Falls back to partial data when the person lookup is pending/failed.
+        """
+        if person_data and person_data.get('status') != 'pending':
+            # Copy, since founders sharing a person ID share one lookup result
+            founder_data = {**person_data, 'email': email}
             
-            # Get full person details
-            person_data = self.get_person(person_id)
-            if person_data and person_data.get('status') != 'pending':
-                # Get email
-                email = self.get_person_email(person_id)
-                person_data['email'] = email
-                
-                # Use title from founder_info if current_position_title is empty
-                if not person_data.get('title') and founder.get('title'):
-                    person_data['title'] = founder.get('title')
-                
-                enriched_founders.append(person_data)
-            else:
-                # Include partial data from founder_info
-                enriched_founders.append({
-                    'person_id': person_id,
-                    'full_name': founder.get('full_name', 'Unknown'),
-                    'first_name': founder.get('full_name', '').split()[0] if founder.get('full_name') else '',
-                    'last_name': ' '.join(founder.get('full_name', '').split()[1:]) if founder.get('full_name') else '',
-                    'title': founder.get('title', ''),
-                    'email': None,
-                    'linkedin_url': '',
-                    'status': 'pending'
-                })
+            # Use title from founder_info if current_position_title is empty
+            if not founder_data.get('title') and founder.get('title'):
+                founder_data['title'] = founder.get('title')
+            
+            return founder_data
         
-        return enriched_founders
-
+        # Include partial data from founder_info
+        return _build_partial_founder(founder, email)
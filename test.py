@@ -5,83 +5,113 @@ Usage: python test.py [command] [args]
 """
 
 import sys
+import argparse
 import logging
-from enrichment_logic import EnrichmentService
+import serialization
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 
-# Configure logging to show enrichment steps
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(message)s'
-)
+# Concurrent enrichments in bulk mode
+BULK_WORKERS = 16
 
-# Suppress noisy external loggers
-logging.getLogger('openai').setLevel(logging.WARNING)
-logging.getLogger('requests').setLevel(logging.WARNING)
-logging.getLogger('httpx').setLevel(logging.WARNING)
+# Seconds founder lookups keep polling Specter enrichment in progress (the API path doesn't wait)
+CLI_POLL_MAX_WAIT = 30.0
 
-def print_header(text):
-    """Print a section header"""
-    print(f"\n{'='*60}")
-    print(f"  {text}")
-    print(f"{'='*60}")
+def configure_logging():
+    """Show enrichment steps (on stderr) and suppress noisy external loggers"""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(message)s'
+    )
+    for name in ('openai', 'requests', 'urllib3', 'httpx'):
+        logging.getLogger(name).setLevel(logging.WARNING)
 
-def print_success(msg):
-    """Print success message"""
-    print(f"✅ {msg}")
+# Shared across commands so one CLI run reuses the clients and their connection pools
+_SERVICE = None
 
-def print_error(msg):
-    """Print error message"""
-    print(f"❌ {msg}")
+def _service():
+    """Return the shared EnrichmentService, creating it on first use"""
+    global _SERVICE
+    if _SERVICE is None:
+        # Imported here so usage/help doesn't pay for loading the API client stack
+        from enrichment_logic import EnrichmentService
+        _SERVICE = EnrichmentService()
+    return _SERVICE
 
-def print_info(msg):
-    """Print info message"""
-    print(f"ℹ️  {msg}")
+class Output:
+    """Buffers CLI output lines and writes each section to stdout in one call"""
+    
+    def __init__(self):
+        self.lines = []
+    
+    def line(self, text=""):
+        self.lines.append(text)
+    
+    def header(self, text):
+        """Section header"""
+        self.lines += [f"\n{'='*60}", f"  {text}", f"{'='*60}"]
+    
+    def success(self, msg):
+        self.lines.append(f"✅ {msg}")
+    
+    def error(self, msg):
+        self.lines.append(f"❌ {msg}")
+    
+    def info(self, msg):
+        self.lines.append(f"ℹ️  {msg}")
+    
+    def flush(self):
+        """Write the buffered section and clear the buffer"""
+        sys.stdout.write("\n".join(self.lines) + "\n")
+        sys.stdout.flush()
+        self.lines.clear()
 
-def test_full_pipeline(domain, list_source):
+def test_full_pipeline(domain, list_source, no_cache=False):
     """Test complete enrichment pipeline using EnrichmentService (Specter-based)"""
-    print_header(f"Testing: {domain} ({list_source})")
-    print_info("Using Specter API (production flow)")
-    print()
+    out = Output()
+    out.header(f"Testing: {domain} ({list_source})")
+    out.info("Using Specter API (production flow)")
+    out.line()
+    out.flush()
     
     # Use the actual EnrichmentService (same as production)
-    service = EnrichmentService()
-    result = service.enrich_company(domain, list_source)
+    result = _service().enrich_company(domain, list_source, bypass_cache=no_cache,
+                                     poll_max_wait=CLI_POLL_MAX_WAIT)
     
     # Display results
-    print_header("RESULTS")
+    out.header("RESULTS")
     
     status = result.get('status', 'unknown')
     if status == 'enriched':
-        print_success(f"Status: {status.upper()}")
+        out.success(f"Status: {status.upper()}")
     elif status == 'partial':
-        print_info(f"Status: {status.upper()}")
+        out.info(f"Status: {status.upper()}")
     else:
-        print_error(f"Status: {status.upper()}")
+        out.error(f"Status: {status.upper()}")
     
     if result.get('message'):
-        print_info(f"Message: {result['message']}")
+        out.info(f"Message: {result['message']}")
     
     company = result.get('company', {})
     if company:
-        print_info(f"Company: {company.get('name', 'Unknown')}")
-        print_info(f"Industry: {company.get('industry', 'Unknown')}")
-        print_info(f"Location: {company.get('location', 'Unknown')}")
+        out.info(f"Company: {company.get('name', 'Unknown')}")
+        out.info(f"Industry: {company.get('industry', 'Unknown')}")
+        out.info(f"Location: {company.get('location', 'Unknown')}")
     
-    print_info(f"Owner: {result.get('owner', 'Unknown')}")
+    out.info(f"Owner: {result.get('owner', 'Unknown')}")
     
     founders = result.get('founders', [])
-    print_info(f"Founders found: {len(founders)}")
+    out.info(f"Founders found: {len(founders)}")
     
     if founders:
-        print_info("\nFounders:")
+        out.info("\nFounders:")
         for i, founder in enumerate(founders, 1):
-            print(f"  [{i}] {founder.get('first_name', '')} {founder.get('last_name', '')}")
-            print(f"      Title: {founder.get('title', 'N/A')}")
-            print(f"      Email: {founder.get('email', 'N/A')}")
-            print(f"      LinkedIn: {founder.get('linkedin', 'N/A')}")
+            out.line(f"  [{i}] {founder.get('first_name', '')} {founder.get('last_name', '')}")
+            out.line(f"      Title: {founder.get('title', 'N/A')}")
+            out.line(f"      Email: {founder.get('email', 'N/A')}")
+            out.line(f"      LinkedIn: {founder.get('linkedin', 'N/A')}")
             if founder.get('generated_email'):
                 preview = founder['generated_email'][:80].replace('\n', ' ')
-                print(f"      Email preview: {preview}...")
+                out.line(f"      Email preview: {preview}...")
     
     # Show investors
     investors = []
@@ -92,29 +122,90 @@ def test_full_pipeline(domain, list_source):
             investors.append({'name': name, 'domain': domain})
     
     if investors:
-        print_info(f"\nTop Investors ({len(investors)}):")
+        out.info(f"\nTop Investors ({len(investors)}):")
         for i, inv in enumerate(investors, 1):
-            print(f"  [{i}] {inv['name']} -> {inv['domain'] or 'no domain'}")
+            out.line(f"  [{i}] {inv['name']} -> {inv['domain'] or 'no domain'}")
     
-    print()
+    out.line()
+    out.flush()
+
+def _enrich_row(service, line, no_cache=False):
+    """Enrich one NDJSON input line; errors are returned as result rows"""
+    try:
+        row = serialization.loads(line)
+        result = service.enrich_company(row['domain'], row['list_source'], bypass_cache=no_cache,
+                                        poll_max_wait=CLI_POLL_MAX_WAIT)
+        return {"domain": row['domain'], "list_source": row['list_source'], **result}
+    except Exception as e:
+        return {"input": line, "status": "error", "message": str(e)}
+
+def _emit_rows(futures):
+    """Write finished results to stdout as NDJSON (bytes straight to the buffer, no str round-trip)"""
+    for future in futures:
+        sys.stdout.buffer.write(serialization.dumps(future.result()) + b"\n")
+    sys.stdout.buffer.flush()
+
+def test_bulk_pipeline(path, workers=BULK_WORKERS, no_cache=False):
+    """
+    Enrich every line of an NDJSON file ({"domain": ..., "list_source": ...})
+    with up to `workers` enrichments in flight, streaming results to stdout as NDJSON
+    in completion order. Logs go to stderr.
+    """
+    service = _service()
+    in_flight = set()
+    
+    with open(path) as f, ThreadPoolExecutor(max_workers=workers) as executor:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            in_flight.add(executor.submit(_enrich_row, service, line, no_cache))
+            
+            # Bound the backlog so large files are streamed, not loaded up front
+            if len(in_flight) >= workers * 4:
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                _emit_rows(done)
+        
+        _emit_rows(wait(in_flight).done)
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        description="Company enrichment CLI",
+        epilog=(
+            "Example:\n"
+            "  python test.py full exactrx.ai james-test\n"
+            "  python test.py full besolo.io zi-test\n"
+            "  python test.py bulk domains.ndjson > results.ndjson"
+        ),
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    # --no-cache skips cached company, founder and email lookups and classifications
+    no_cache = argparse.ArgumentParser(add_help=False)
+    no_cache.add_argument("--no-cache", action="store_true", help="skip cached lookups and fetch fresh results")
+    
+    commands = parser.add_subparsers(dest="command")
+    full = commands.add_parser("full", parents=[no_cache], help="enrich one domain and print a report")
+    full.add_argument("domain")
+    full.add_argument("list_source")
+    bulk = commands.add_parser("bulk", parents=[no_cache], help="enrich an NDJSON file, streaming NDJSON results")
+    bulk.add_argument("path", help='NDJSON file of {"domain": ..., "list_source": ...} lines')
+    return parser
 
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: python test.py full <domain> <list_source>")
-        print("\nExample:")
-        print("  python test.py full exactrx.ai james-test")
-        print("  python test.py full besolo.io zi-test")
-        return
-    
-    command = sys.argv[1].lower()
-    
-    if command == "full" and len(sys.argv) >= 4:
-        domain = sys.argv[2]
-        list_source = sys.argv[3]
-        test_full_pipeline(domain, list_source)
+    parser = build_parser()
+    args = parser.parse_args()
+    configure_logging()
+    
+    if args.command:
+        # Handshakes run in the background while the pipeline starts up
+        _service().warm_up()
+    
+    if args.command == "full":
+        test_full_pipeline(args.domain, args.list_source, no_cache=args.no_cache)
+    elif args.command == "bulk":
+        test_bulk_pipeline(args.path, no_cache=args.no_cache)
     else:
-        print("❌ Invalid command or missing arguments")
-        print("Usage: python test.py full <domain> <list_source>")
+        parser.print_help()
 
 if __name__ == "__main__":
     main()